@@ -1,40 +1,61 @@
+from collections import namedtuple
+import functools
 from importlib.resources import files
-import pandas
+import json
 import re
+import sys
 from types import MappingProxyType
 import yaml
 
+try:
+    # use the libyaml-backed loader when available; it is much faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 DELETE_SETTINGS_KEY = "delete_settings"
 PROFILE_NAME_KEY = "profile_name"
 
 _MACHINE_PREFIX_KEY = 'machine_prefix'
-_MODEL_TYPE_KEY = 'model'
 _MODEL_NAME_KEY = 'model_name'
-_RUN_CENTER_KEY = 'run_center'
 _REVCOMP_I5_KEY = "revcomp_samplesheet_i5_index"
 
 _LAB_RUN_CENTER = "UCSDMI"
+# the machine code is everything before the first number
+# (we expect these to be letters, so pattern could be improved ...)
+_MACHINE_CODE_RE = re.compile(r"^(.*?)\d")
+# types whose instances _deep_freeze can return as-is
+_FROZEN_TYPES = (str, int, float, bool, type(None), MappingProxyType,
+                 frozenset)
+_EXACT_FROZEN_TYPES = frozenset(_FROZEN_TYPES)
 _SEQUENCER_TYPES_DIR = "config"
 _SEQUENCER_TYPES_YML_FNAME = 'sequencer_types.yml'
+# JSON copy of the yaml file, which is much faster to parse; the yaml file
+# remains the source of truth (see _write_sequencer_types_json)
+_SEQUENCER_TYPES_JSON_FNAME = 'sequencer_types.json'
 
 # DEPRECATED: We no longer want to identify sequencer types by the
 # instrument id, since that requires a change for every new physical machine.
 # This is kept for backwards compatibility with existing data, but for anything
 # new, we should use the instrument type instead.
-# _MODEL_TYPE_KEY values must match to a key in the sequencer_types.yml file.
-_INSTRUMENT_LOOKUP = pandas.DataFrame({
-    'FS10001773': {_MODEL_TYPE_KEY: 'iSeq', _RUN_CENTER_KEY: 'KLM'},
-    'A00953': {_MODEL_TYPE_KEY: 'NovaSeq6000', _RUN_CENTER_KEY: 'IGM'},
-    'A00169': {_MODEL_TYPE_KEY: 'NovaSeq6000', _RUN_CENTER_KEY: 'LJI'},
-    'M05314': {_MODEL_TYPE_KEY: 'MiSeq', _RUN_CENTER_KEY: 'KLM'},
-    'K00180': {_MODEL_TYPE_KEY: 'HiSeq4000', _RUN_CENTER_KEY: 'IGM'},
-    'D00611': {_MODEL_TYPE_KEY: 'HiSeq2500', _RUN_CENTER_KEY: 'IGM'},
-    'LH00444': {_MODEL_TYPE_KEY: 'NovaSeqX', _RUN_CENTER_KEY: 'IGM'},
-    'SH00252': {_MODEL_TYPE_KEY: 'MiSeqi100', _RUN_CENTER_KEY: 'IGM'},
-    'MN01225': {_MODEL_TYPE_KEY: 'MiniSeq', _RUN_CENTER_KEY: 'CMI'}}).T
-
-
-def _deep_freeze(obj):
+# Maps instrument id to (model type, run center); model type values must match
+# to a key in the sequencer_types.yml file.
+_INSTRUMENT_LOOKUP = {
+    'FS10001773': ('iSeq', 'KLM'),
+    'A00953': ('NovaSeq6000', 'IGM'),
+    'A00169': ('NovaSeq6000', 'LJI'),
+    'M05314': ('MiSeq', 'KLM'),
+    'K00180': ('HiSeq4000', 'IGM'),
+    'D00611': ('HiSeq2500', 'IGM'),
+    'LH00444': ('NovaSeqX', 'IGM'),
+    'SH00252': ('MiSeqi100', 'IGM'),
+    'MN01225': ('MiniSeq', 'CMI')}
+# an _INSTRUMENT_LOOKUP entry's run center and the model name its model type
+# resolves to
+_InstrumentEntry = namedtuple('_InstrumentEntry', ['run_center', 'model_name'])
+
+
+def _deep_freeze(obj, _memo=None):
     """Recursively freeze a Python object to make it immutable.
     This function converts mutable objects (dicts, lists, sets) into their
     immutable counterparts (MappingProxyType, tuples, frozensets) while
@@ -45,6 +66,10 @@ def _deep_freeze(obj):
     obj: Any
         The object to freeze. It can be a dict, list, set, tuple, or any
         immutable type (like str, int, float, etc.).
+    _memo: dict, optional
+        For internal use only: maps the id of each container already frozen
+        during this call to its frozen version, so that containers shared
+        in several places (e.g., via yaml anchors) are frozen only once.
 
     Returns
     -------
@@ -54,22 +79,50 @@ def _deep_freeze(obj):
         if it's a set, it returns a frozenset; otherwise, it returns the
         original object unchanged.
     """
+    if type(obj) is str:
+        # Share one object per distinct string value (e.g., the model and
+        # profile names repeated across sequencer types and lookups)
+        return sys.intern(obj)
+    elif type(obj) in _EXACT_FROZEN_TYPES:
+        # Fast path for the common case of a leaf value (or frozen mapping);
+        # a set lookup on the exact type is cheaper than isinstance checks
+        return obj
+    elif isinstance(obj, (MappingProxyType, frozenset)):
+        # Already frozen (as are any values of a frozen input), so don't copy
+        return obj
+    elif isinstance(obj, tuple) and \
+            all(isinstance(v, _FROZEN_TYPES) for v in obj):
+        # Tuple holding only frozen values is already frozen, so don't copy
+        return obj
+
+    # NB: the memo must only live for a single top-level call: ids are only
+    # unique among objects that are alive at the same time
+    if _memo is None:
+        _memo = {}
+    elif id(obj) in _memo:
+        return _memo[id(obj)]
+
     if isinstance(obj, dict):
         # Recursively freeze values and return a read-only MappingProxyType
-        return MappingProxyType({k: _deep_freeze(v) for k, v in obj.items()})
+        # (the comprehension's dict is the proxy's backing store, not a copy)
+        frozen = MappingProxyType(
+            {k: _deep_freeze(v, _memo) for k, v in obj.items()})
     elif isinstance(obj, list):
         # Convert list to tuple after freezing elements
-        return tuple(_deep_freeze(v) for v in obj)
+        frozen = tuple([_deep_freeze(v, _memo) for v in obj])
     elif isinstance(obj, set):
         # Convert set to frozenset after freezing elements
-        return frozenset(_deep_freeze(v) for v in obj)
+        frozen = frozenset([_deep_freeze(v, _memo) for v in obj])
     elif isinstance(obj, tuple):
         # Freeze all elements in the tuple
-        return tuple(_deep_freeze(v) for v in obj)
+        frozen = tuple([_deep_freeze(v, _memo) for v in obj])
     else:
         # Assume everything else is immutable
         return obj
 
+    _memo[id(obj)] = frozen
+    return frozen
+
 
 def _load_sequencer_types(existing_types=None, test_only_fp=None):
     """Load sequencer types from sequencer types yaml file.
@@ -78,8 +131,9 @@ def _load_sequencer_types(existing_types=None, test_only_fp=None):
     ----------
     existing_types: MappingProxyType, optional
         A mapping of sequencer types to use instead of loading from file.
-        If None, the sequencer types will be loaded from the YAML file; if
-        provided, will short-circuit the loading process and return input.
+        If None, the sequencer types will be loaded from the YAML file (which
+        is parsed only once and then cached); if provided, will short-circuit
+        the loading process and return input.
     test_only_fp: str, optional
         For testing purposes ONLY, a test file path to load the sequencer
         types from. If None, the default sequencer types YAML file will be
@@ -96,32 +150,127 @@ def _load_sequencer_types(existing_types=None, test_only_fp=None):
         If existing_types is not a MappingProxyType or None.
     """
 
-    if existing_types is not None:
-        # if an existing mapping is provided, use it
-        if not isinstance(existing_types, MappingProxyType):
-            raise ValueError(
-                "existing_types must be a MappingProxyType or None.")
-        # end if existing_types is not a MappingProxyType
+    if existing_types is None:
+        # the file contents never change while running, so parse them once
+        return _read_sequencer_types_file(test_only_fp)
+    # end if existing_types is None
+
+    # if an existing mapping is provided, use it
+    if not isinstance(existing_types, MappingProxyType):
+        raise ValueError(
+            "existing_types must be a MappingProxyType or None.")
+    # end if existing_types is not a MappingProxyType
+
+    immutable_sequencer_types = _deep_freeze(existing_types)
+    return immutable_sequencer_types
 
-        sequencer_types = existing_types
-    else:
-        if test_only_fp is None:
-            # get the path to the directory above the one this file is in
-            files_dir = files('metapool')
-            sequencers_fp = files_dir.joinpath(
-                f"{_SEQUENCER_TYPES_DIR}/{_SEQUENCER_TYPES_YML_FNAME}")
-        else:
-            # for testing, use the provided file path
-            sequencers_fp = test_only_fp
 
-        with open(sequencers_fp, 'r') as file:
-            sequencer_types = yaml.safe_load(file)
-    # end if existing_types is None or not
+@functools.lru_cache(maxsize=1)
+def _read_sequencer_types_file(test_only_fp=None):
+    """Read and freeze sequencer types from the sequencer types yaml file.
+
+    Results are cached, so the file is only opened and parsed the first time
+    it is requested; later calls return the same immutable object.
+
+    Parameters
+    ----------
+    test_only_fp: str, optional
+        For testing purposes ONLY, a test file path to load the sequencer
+        types from. If None, the default sequencer types will be used (read
+        from the json copy of the YAML file if it exists, since that is
+        faster to parse); should always be None in production code.
+
+    Returns
+    -------
+    MappingProxyType
+        Immutable dictionary of sequencer types.
+    """
+    if test_only_fp is None:
+        # get the path to the directory above the one this file is in
+        files_dir = files('metapool')
+        json_fp = files_dir.joinpath(
+            f"{_SEQUENCER_TYPES_DIR}/{_SEQUENCER_TYPES_JSON_FNAME}")
+        if json_fp.is_file():
+            with json_fp.open('r') as file:
+                sequencer_types = json.load(file)
+        else:
+            sequencer_types = _parse_sequencer_types_yml(files_dir.joinpath(
+                f"{_SEQUENCER_TYPES_DIR}/{_SEQUENCER_TYPES_YML_FNAME}"))
+        # end if the pre-serialized json copy is available or not
+    else:
+        # for testing, use the provided file path
+        sequencer_types = _parse_sequencer_types_yml(test_only_fp)
 
     immutable_sequencer_types = _deep_freeze(sequencer_types)
+    # validate once here so lookups on these cached types need not re-check
+    _validate_sequencer_types(immutable_sequencer_types)
     return immutable_sequencer_types
 
 
+def _validate_sequencer_types(sequencer_types):
+    """Check that the info for every sequencer type is a MappingProxyType.
+
+    Parameters
+    ----------
+    sequencer_types: MappingProxyType
+        A mapping of sequencer types to validate.
+
+    Raises
+    ------
+    ValueError
+        If the info for a sequencer type is not a MappingProxyType.
+    """
+    for name, details in sequencer_types.items():
+        if not isinstance(details, MappingProxyType):
+            raise ValueError(
+                f"Info for sequencer type '{name}' is not a MappingProxyType.")
+    # next sequencer type
+
+
+def _parse_sequencer_types_yml(sequencers_fp):
+    """Parse a sequencer types yaml file into (mutable) python objects.
+
+    Parameters
+    ----------
+    sequencers_fp: str or Traversable
+        Path to the sequencer types yaml file.
+
+    Returns
+    -------
+    dict
+        Dictionary of sequencer types.
+    """
+    with open(sequencers_fp, 'r') as file:
+        sequencer_types = yaml.load(file, Loader=_YamlLoader)
+    return sequencer_types
+
+
+def _write_sequencer_types_json(yml_fp=None, json_fp=None):
+    """Regenerate the json copy of the sequencer types yaml file.
+
+    Must be rerun whenever the sequencer types yaml file is edited.
+
+    Parameters
+    ----------
+    yml_fp: str, optional
+        Path to the sequencer types yaml file to read. If None, the default
+        sequencer types yaml file will be used.
+    json_fp: str, optional
+        Path to the json file to write. If None, the default sequencer types
+        json file will be written.
+    """
+    config_dir = files('metapool').joinpath(_SEQUENCER_TYPES_DIR)
+    if yml_fp is None:
+        yml_fp = config_dir.joinpath(_SEQUENCER_TYPES_YML_FNAME)
+    if json_fp is None:
+        json_fp = config_dir.joinpath(_SEQUENCER_TYPES_JSON_FNAME)
+
+    sequencer_types = _parse_sequencer_types_yml(yml_fp)
+    with open(json_fp, 'w') as file:
+        json.dump(sequencer_types, file, indent=4)
+        file.write("\n")
+
+
 def _get_machine_code(instrument_model):
     """Get the machine code for an instrument's model string
 
@@ -142,9 +291,7 @@ def _get_machine_code(instrument_model):
         If the instrument model is malformed and does not contain a valid
         machine code.
     """
-    # the machine code is everything before the first number
-    # (we expect these to be letters, so pattern could be improved ...)
-    matches = re.match(r"^(.*?)\d.*", instrument_model)
+    matches = _MACHINE_CODE_RE.match(instrument_model)
 
     if matches is not None:
         machine_code = matches.group(1)
@@ -155,6 +302,81 @@ def _get_machine_code(instrument_model):
                      f"model '{instrument_model}' is malformed.")
 
 
+def _build_key_index(sequencer_types, key):
+    """Group the names of sequencer types by their value for a given key.
+
+    Parameters
+    ----------
+    sequencer_types: MappingProxyType
+        A mapping of sequencer types to index; the info for every sequencer
+        type must be a MappingProxyType.
+    key: str
+        The key whose (hashable) values to index by.
+
+    Returns
+    -------
+    MappingProxyType
+        Immutable dictionary mapping each value found for the key to a tuple
+        of the names of the sequencer types with that value, in the order
+        they appear in sequencer_types. Sequencer types without the key are
+        not included.
+    """
+    index = {}
+    for name, details in sequencer_types.items():
+        if key in details:
+            index.setdefault(details[key], []).append(name)
+    # next sequencer type
+
+    return MappingProxyType({k: tuple(v) for k, v in index.items()})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_key_index(key):
+    """Get the (cached) index of the default sequencer types for a key.
+
+    Parameters
+    ----------
+    key: str
+        The key whose values to index by.
+
+    Returns
+    -------
+    MappingProxyType
+        See _build_key_index.
+    """
+    return _build_key_index(_load_sequencer_types(), key)
+
+
+def _get_key_index(key, sequencer_types=None):
+    """Get the index of names of sequencer types by their value for a key.
+
+    Parameters
+    ----------
+    key: str
+        The key whose values to index by.
+    sequencer_types: MappingProxyType, optional
+        A mapping of available sequencer types. If None (or if it is the
+        default sequencer types), a cached index of the default sequencer
+        types is returned.
+
+    Returns
+    -------
+    MappingProxyType
+        See _build_key_index.
+
+    Raises
+    ------
+    ValueError
+        If the info for a sequencer type is not a MappingProxyType.
+    """
+    if sequencer_types is None or \
+            sequencer_types is _load_sequencer_types():
+        return _get_default_key_index(key)
+
+    _validate_sequencer_types(sequencer_types)
+    return _build_key_index(sequencer_types, key)
+
+
 def _get_model_by_machine_prefix(
         instrument_prefix, sequencer_types=None, model_key=_MODEL_NAME_KEY):
     """Get the instrument model by its machine prefix.
@@ -164,8 +386,9 @@ def _get_model_by_machine_prefix(
     instrument_prefix: str
         The machine prefix of the instrument, e.g., 'MN' for MN01225.
     sequencer_types: MappingProxyType, optional
-        A mapping of available sequencer types. If None, the
-        sequencer types will be loaded from the YAML file.
+        A mapping of available sequencer types, already checked by
+        _load_sequencer_types. If None, the sequencer types will be loaded
+        from the YAML file.
     model_key: str, optional
         The key in which to look for the model name to return from the
         sequencer types. Defaults to _MODEL_NAME_KEY.
@@ -182,9 +405,10 @@ def _get_model_by_machine_prefix(
         If the instrument prefix is not recognized or if multiple
         sequencer types match the given prefix.
     """
-    models_w_prefix = get_sequencers_w_key_value(
-        _MACHINE_PREFIX_KEY, instrument_prefix,
-        existing_types=sequencer_types)
+    if sequencer_types is None:
+        sequencer_types = _load_sequencer_types()
+    prefix_index = _get_key_index(_MACHINE_PREFIX_KEY, sequencer_types)
+    models_w_prefix = prefix_index.get(instrument_prefix, ())
     if len(models_w_prefix) == 0:
         raise ValueError(
             f"Unrecognized {_MACHINE_PREFIX_KEY} '{instrument_prefix}'.")
@@ -195,10 +419,9 @@ def _get_model_by_machine_prefix(
             f"{', '.join(models_w_prefix)}.")
     # end if got an unexpected number of sequencer types w given prefix
 
-    inst_model_type = next(iter(models_w_prefix))
-    instrument_model = _get_model_by_sequencer_type_name(
-        inst_model_type, sequencer_types=models_w_prefix,
-        model_key=model_key)
+    # the index already gives the one matching sequencer type, so read its
+    # model straight from the mapping
+    instrument_model = sequencer_types[models_w_prefix[0]][model_key]
     return instrument_model
 
 
@@ -261,23 +484,83 @@ def get_model_and_center(instrument_code):
     """
 
     run_center = _LAB_RUN_CENTER  # Default run center for lab data
-    available_sequencer_types = _load_sequencer_types()
 
     instrument_id = instrument_code.split('_')[0]
-    if instrument_id in _INSTRUMENT_LOOKUP.index:
-        run_center = _INSTRUMENT_LOOKUP.loc[instrument_id, _RUN_CENTER_KEY]
-        inst_model_type = _INSTRUMENT_LOOKUP.loc[
-            instrument_id, _MODEL_TYPE_KEY]
-        instrument_model = _get_model_by_sequencer_type_name(
-            inst_model_type, sequencer_types=available_sequencer_types)
+    if instrument_id in _INSTRUMENT_LOOKUP:
+        run_center, instrument_model = \
+            _get_resolved_instrument_entry(instrument_id)
     else:
-        instrument_model = get_model_by_instrument_id(
-            instrument_id, sequencer_types=available_sequencer_types)
+        # same as get_model_by_instrument_id, minus re-checking the types
+        instrument_model = _get_model_by_machine_prefix(
+            _get_machine_code(instrument_id))
     # end if instrument_id is in the lookup or if must look up by prefix
 
     return instrument_model, run_center
 
 
+@functools.lru_cache(maxsize=None)
+def _get_resolved_instrument_entry(instrument_id):
+    """Get (cached) _INSTRUMENT_LOOKUP entry with its model name resolved.
+
+    Each entry is resolved only when first looked up, so an entry whose
+    model type can't be resolved fails only lookups of that instrument id.
+
+    Parameters
+    ----------
+    instrument_id: str
+        An instrument id in _INSTRUMENT_LOOKUP.
+
+    Returns
+    -------
+    _InstrumentEntry
+        See _resolve_instrument_entry.
+
+    Raises
+    ------
+    ValueError
+        See _resolve_instrument_entry.
+    """
+    return _resolve_instrument_entry(
+        instrument_id, _INSTRUMENT_LOOKUP, _load_sequencer_types())
+
+
+def _resolve_instrument_entry(instrument_id, instrument_lookup,
+                              sequencer_types):
+    """Resolve the model name of one entry in an instrument lookup.
+
+    Parameters
+    ----------
+    instrument_id: str
+        The instrument id whose entry to resolve.
+    instrument_lookup: dict
+        Maps instrument id to (model type, run center), as _INSTRUMENT_LOOKUP.
+    sequencer_types: MappingProxyType
+        A mapping of available sequencer types.
+
+    Returns
+    -------
+    _InstrumentEntry
+        The entry's run center and model name.
+
+    Raises
+    ------
+    ValueError
+        If the entry's model type is not in the sequencer types or does not
+        have a model name.
+    """
+    model_type, run_center = instrument_lookup[instrument_id]
+    if _MODEL_NAME_KEY not in sequencer_types.get(model_type, {}):
+        raise ValueError(
+            f"Instrument lookup entry '{instrument_id}' has model type "
+            f"'{model_type}', which is not a sequencer type with a "
+            f"'{_MODEL_NAME_KEY}' key.")
+    # end if model type can't be resolved
+
+    model_name = _get_model_by_sequencer_type_name(
+        model_type, sequencer_types=sequencer_types)
+    return _InstrumentEntry(run_center, model_name)
+
+
 def _get_model_by_sequencer_type_name(
         inst_model_type, sequencer_types, model_key=_MODEL_NAME_KEY):
     """Get the instrument model by its sequencer type name.
@@ -333,23 +616,24 @@ def get_sequencers_w_key_value(key, value, default=None, existing_types=None):
     Raises
     ------
     ValueError
-        If the info for a sequencer type is not a dictionary.
+        If the info for a sequencer type is not a MappingProxyType.
     """
 
     found_sequencers = {}
     sequencer_types = _load_sequencer_types(existing_types)
+    if existing_types is not None:
+        # default sequencer types were already validated when loaded
+        _validate_sequencer_types(sequencer_types)
+
     for name, details in sequencer_types.items():
-        if not isinstance(details, MappingProxyType):
-            raise ValueError(
-                f"Info for sequencer type '{name}' is not a MappingProxyType.")
         found_value = details.get(key, default)
         if found_value == value:
             found_sequencers[name] = details
         # if this sequencer has the desired key-value pair
     # next sequencer type
 
-    immutable_found_sequencers = _deep_freeze(found_sequencers)
-    return immutable_found_sequencers
+    # values are already-validated MappingProxyTypes, so just wrap the dict
+    return MappingProxyType(found_sequencers)
 
 
 def get_i5_index_sequencers(existing_types=None):
@@ -367,15 +651,45 @@ def get_i5_index_sequencers(existing_types=None):
         Immutable dictionary of sequencer types that use an i5 index, with or
         without revcomping.
     """
-    result = MappingProxyType({})
     available_sequencer_types = _load_sequencer_types(existing_types)
+    if available_sequencer_types is _load_sequencer_types():
+        return _get_default_i5_index_sequencers()
+    return _find_i5_index_sequencers(available_sequencer_types)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_i5_index_sequencers():
+    """Get (cached) default sequencer types that use an i5 index.
+
+    Returns
+    -------
+    MappingProxyType
+        See _find_i5_index_sequencers.
+    """
+    return _find_i5_index_sequencers(_load_sequencer_types())
+
+
+def _find_i5_index_sequencers(sequencer_types):
+    """Find sequencer types that use an i5 index, revcomped or not.
+
+    Parameters
+    ----------
+    sequencer_types: MappingProxyType
+        A mapping of available sequencer types.
+
+    Returns
+    -------
+    MappingProxyType
+        Immutable dictionary of sequencer types that use an i5 index, with or
+        without revcomping.
+    """
+    revcomp_index = _get_key_index(_REVCOMP_I5_KEY, sequencer_types)
+    found_sequencers = {}
     for curr_bool_val in [True, False]:
-        curr_mapping_proxy = get_sequencers_w_key_value(
-            _REVCOMP_I5_KEY, curr_bool_val,
-            existing_types=available_sequencer_types)
-        result = MappingProxyType(result | curr_mapping_proxy)
+        for name in revcomp_index.get(curr_bool_val, ()):
+            found_sequencers[name] = sequencer_types[name]
     # next boolean value
-    return result
+    return MappingProxyType(found_sequencers)
 
 
 def get_sequencer_type(sequencer_type, existing_types=None):
@@ -400,6 +714,53 @@ def get_sequencer_type(sequencer_type, existing_types=None):
         If the sequencer type is not found in the available sequencer types.
     """
     sequencer_types = _load_sequencer_types(existing_types)
+    if sequencer_types is _load_sequencer_types():
+        return _get_default_sequencer_type(sequencer_type)
+    return _find_sequencer_type(sequencer_type, sequencer_types)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_default_sequencer_type(sequencer_type):
+    """Get (cached) sequencer type info from the default sequencer types.
+
+    Parameters
+    ----------
+    sequencer_type: str
+        The name of the sequencer type to retrieve.
+
+    Returns
+    -------
+    MappingProxyType
+        See _find_sequencer_type.
+
+    Raises
+    ------
+    ValueError
+        If the sequencer type is not found in the default sequencer types.
+    """
+    return _find_sequencer_type(sequencer_type, _load_sequencer_types())
+
+
+def _find_sequencer_type(sequencer_type, sequencer_types):
+    """Find the sequencer type info in the given sequencer types.
+
+    Parameters
+    ----------
+    sequencer_type: str
+        The name of the sequencer type to retrieve.
+    sequencer_types: MappingProxyType
+        A mapping of available sequencer types.
+
+    Returns
+    -------
+    MappingProxyType
+        Immutable dictionary of the sequencer type details.
+
+    Raises
+    ------
+    ValueError
+        If the sequencer type is not found in the available sequencer types.
+    """
     if sequencer_type in sequencer_types:
         return _deep_freeze(sequencer_types[sequencer_type])
     # end if sequencer type is in the available sequencers
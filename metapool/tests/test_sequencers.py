@@ -1,12 +1,53 @@
+from importlib.resources import files
+import json
+from metapool import sequencers
 from metapool.sequencers import _deep_freeze, _get_machine_code, \
+    _InstrumentEntry, _resolve_instrument_entry, \
+    _load_sequencer_types, _parse_sequencer_types_yml, _get_key_index, \
     get_model_and_center, get_sequencers_w_key_value, get_sequencer_type, \
     get_i5_index_sequencers, is_i5_revcomp_sequencer, \
     get_model_by_instrument_id, PROFILE_NAME_KEY
+from subprocess import run
+import sys
 from types import MappingProxyType
 from unittest import TestCase, main
+from unittest.mock import patch
 
 
 class TestSequencers(TestCase):
+    def test__deep_freeze(self):
+        shared = {'machine_prefix': 'MN', 'delete_settings': ['A', 'B']}
+        obs = _deep_freeze({'MiniSeq': shared, 'MiniSeq2': shared,
+                            'tags': {'x'}, 'pair': ([1], 2)})
+
+        self.assertIsInstance(obs, MappingProxyType)
+        self.assertIsInstance(obs['MiniSeq'], MappingProxyType)
+        self.assertEqual(obs['MiniSeq']['delete_settings'], ('A', 'B'))
+        self.assertEqual(obs['tags'], frozenset({'x'}))
+        self.assertEqual(obs['pair'], ((1,), 2))
+        # a container referenced in several places is frozen only once
+        self.assertIs(obs['MiniSeq'], obs['MiniSeq2'])
+
+    def test__deep_freeze_interns_strings(self):
+        # build equal strings at runtime so they start as distinct objects
+        first = ''.join(['Illumina ', 'MiSeq'])
+        second = ''.join(['Illumina M', 'iSeq'])
+        obs = _deep_freeze({'a': first, 'b': [second]})
+        self.assertIs(obs['a'], obs['b'][0])
+
+    def test__deep_freeze_already_frozen(self):
+        """Test already-immutable inputs are returned without copying."""
+        frozen_mapping = MappingProxyType({'a': 1})
+        frozen_set = frozenset({'a'})
+        frozen_tuple = ('a', 1, None, frozen_mapping)
+        self.assertIs(_deep_freeze(frozen_mapping), frozen_mapping)
+        self.assertIs(_deep_freeze(frozen_set), frozen_set)
+        self.assertIs(_deep_freeze(frozen_tuple), frozen_tuple)
+
+        # a tuple holding a mutable value is still frozen into a new tuple
+        obs = _deep_freeze(('a', ['b']))
+        self.assertEqual(obs, ('a', ('b',)))
+
     def test__get_machine_code(self):
         obs = _get_machine_code('K00180')
         self.assertEqual(obs, 'K')
@@ -23,6 +64,51 @@ class TestSequencers(TestCase):
         with self.assertRaisesRegex(ValueError, err):
             _get_machine_code('8675309')
 
+    def test__load_sequencer_types_cached(self):
+        """Test default sequencer types are parsed once and reused."""
+        first = _load_sequencer_types()
+        second = _load_sequencer_types()
+        self.assertIsInstance(first, MappingProxyType)
+        self.assertIs(first, second)
+
+    def test__load_sequencer_types_not_at_import(self):
+        """Test importing the module does not read the sequencer types."""
+        # use a fresh interpreter, since other tests have already loaded them
+        code = ("import metapool.sequencers as s; "
+                "print(s._read_sequencer_types_file.cache_info().currsize)")
+        proc = run([sys.executable, "-c", code], capture_output=True,
+                   universal_newlines=True, check=True)
+        self.assertEqual(proc.stdout.strip(), "0")
+
+    def test_sequencer_types_json_matches_yml(self):
+        """Test the json copy of the sequencer types yaml is up to date."""
+        config_dir = files('metapool').joinpath('config')
+        exp = _parse_sequencer_types_yml(
+            config_dir.joinpath('sequencer_types.yml'))
+        with config_dir.joinpath('sequencer_types.json').open('r') as f:
+            obs = json.load(f)
+        self.assertEqual(obs, exp,
+                         msg="sequencer_types.json is stale; regenerate it "
+                             "with _write_sequencer_types_json().")
+
+    def test__get_key_index(self):
+        external_mapping = _deep_freeze({
+            "MiniSeq": {'machine_prefix': 'MN'},
+            "NovaSeqX": {'machine_prefix': 'LH'},
+            "NovaSeqXPlus": {'machine_prefix': 'LH'},
+            "NextSeq": {'model_name': 'Illumina NextSeq 500/550'}
+        })
+
+        obs = _get_key_index('machine_prefix', external_mapping)
+        self.assertEqual(dict(obs), {'MN': ('MiniSeq',),
+                                     'LH': ('NovaSeqX', 'NovaSeqXPlus')})
+
+    def test__get_key_index_default_cached(self):
+        obs = _get_key_index('machine_prefix')
+        self.assertEqual(obs['MN'], ('MiniSeq',))
+        self.assertIs(
+            _get_key_index('machine_prefix', _load_sequencer_types()), obs)
+
     def test_get_model_by_instrument_id(self):
         """Test getting model by machine prefix."""
         obs = get_model_by_instrument_id('MN00178')
@@ -88,6 +174,36 @@ class TestSequencers(TestCase):
         obs = get_model_and_center('MN01225_0002_A000H2W3FY')
         self.assertEqual(obs, ('Illumina MiniSeq', 'CMI'))
 
+    def test__resolve_instrument_entry(self):
+        lookup = {'A00953': ('NovaSeq6000', 'IGM'),
+                  'X00001': ('NotASequencer', 'IGM')}
+        # the bad entry doesn't stop other entries from resolving
+        obs = _resolve_instrument_entry(
+            'A00953', lookup, _load_sequencer_types())
+        self.assertEqual(obs, _InstrumentEntry('IGM', 'Illumina NovaSeq 6000'))
+
+    def test__resolve_instrument_entry_err_unknown_model_type(self):
+        lookup = {'A00953': ('NovaSeq6000', 'IGM'),
+                  'X00001': ('NotASequencer', 'IGM')}
+        err = ("Instrument lookup entry 'X00001' has model type "
+               "'NotASequencer', which is not a sequencer type with a "
+               "'model_name' key.")
+        with self.assertRaisesRegex(ValueError, err):
+            _resolve_instrument_entry(
+                'X00001', lookup, _load_sequencer_types())
+
+    def test_get_model_and_center_bad_lookup_entry_scoped(self):
+        with patch.dict(sequencers._INSTRUMENT_LOOKUP,
+                        {'X00001': ('NotASequencer', 'IGM')}):
+            # other instrument ids, in the lookup or not, are unaffected
+            obs = get_model_and_center('A00953_0032_AHWMGJDDXX')
+            self.assertEqual(obs, ('Illumina NovaSeq 6000', 'IGM'))
+            obs = get_model_and_center('A86753_0365_G00DHB5YXX')
+            self.assertEqual(obs, ('Illumina NovaSeq 6000', 'UCSDMI'))
+
+            with self.assertRaisesRegex(ValueError, "'X00001'"):
+                get_model_and_center('X00001_0001_AHWMGJDDXX')
+
     def test_get_model_and_center_by_model_prefix_err_no_match(self):
         err = ""
         with self.assertRaisesRegex(ValueError, err):
@@ -196,6 +312,14 @@ class TestSequencers(TestCase):
         self.assertIn('NovaSeq6000', obs)
         self.assertIn('MiniSeq', obs)
 
+    def test_get_i5_index_sequencers_default(self):
+        obs = get_i5_index_sequencers()
+        self.assertIn('MiSeq', obs)
+        self.assertIn('iSeq', obs)
+        # MiSeqi100 has no revcomp_samplesheet_i5_index key so not returned
+        self.assertNotIn('MiSeqi100', obs)
+        self.assertIs(get_i5_index_sequencers(), obs)
+
     def test_get_sequencer_type(self):
         external_mapping = MappingProxyType({
             "MiniSeq": {
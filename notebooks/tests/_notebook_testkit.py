@@ -0,0 +1,491 @@
+"""Helpers shared by the notebook tests."""
+import atexit
+import functools
+import hashlib
+import itertools
+import os
+import queue
+import tempfile
+import threading
+import time
+import unittest
+import warnings
+from pathlib import Path
+
+import nbformat
+import papermill as pm
+from jupyter_client.manager import KernelManager
+from nbclient import NotebookClient
+from nbclient.exceptions import CellExecutionError
+from papermill.iorw import load_notebook_node
+from papermill.parameterize import parameterize_notebook
+
+# the notebooks directory, with the notebooks' test inputs and the expected
+# ("golden") versions of the files they produce
+NOTEBOOKS_DIR = Path(__file__).resolve().parent.parent
+TEST_OUTPUT_DIR = NOTEBOOKS_DIR / "test_output"
+TEST_DATA_DIR = NOTEBOOKS_DIR / "test_data"
+
+# subdirectories of notebooks/test_output holding the expected ("golden")
+# versions of the files the notebooks produce
+EXPECTED_SUBDIRS = ("QC", "Indices", "SampleSheets", "Pooling")
+
+# read size used when hashing files to check whether they are byte-identical
+_COMPARE_CHUNK_SIZE = 1 << 20
+
+# Set this environment variable (to any non-empty value) to run all notebooks
+# in one warm, shared kernel rather than starting a new kernel (and
+# re-importing pandas, metapool, etc.) for every notebook run. The kernel's
+# namespace is wiped with %reset between runs, but imported modules persist.
+REUSE_KERNEL_ENV = "METAPOOL_TEST_REUSE_KERNEL"
+# Set this environment variable to the most kernels to keep warm, e.g. when
+# running tests from several threads; a new kernel is started only when a
+# notebook run finds none free, so a serial run still starts just one. It
+# must be a positive integer and, if set, takes precedence over
+# REUSE_KERNEL_ENV, which is equivalent to a pool of one kernel.
+WARM_KERNEL_POOL_ENV = "METAPOOL_TEST_WARM_KERNEL_POOL"
+
+# idle warm kernels, and the number started so far (guarded by the lock)
+_warm_kernel_pool = queue.Queue()
+_warm_kernel_count = 0
+_warm_kernel_lock = threading.Lock()
+# how long, in seconds, a notebook run waits for a warm kernel to become free
+# (e.g. while other runs use them all) before failing, and how often it checks
+# whether it may start a new one instead
+_WARM_KERNEL_CHECKOUT_TIMEOUT = 30 * 60
+_WARM_KERNEL_POLL_INTERVAL = 1
+
+
+def _get_warm_kernel_pool_size():
+    """Get the number of warm kernels requested, or 0 if none are.
+
+    Raises
+    ------
+    ValueError
+        If WARM_KERNEL_POOL_ENV is set to anything but a positive integer.
+    """
+    pool_size_str = os.environ.get(WARM_KERNEL_POOL_ENV)
+    if not pool_size_str:
+        return 1 if os.environ.get(REUSE_KERNEL_ENV) else 0
+
+    try:
+        pool_size = int(pool_size_str)
+    except ValueError:
+        pool_size = 0
+    if pool_size < 1:
+        raise ValueError(
+            f"{WARM_KERNEL_POOL_ENV} must be a positive integer, not "
+            f"'{pool_size_str}'.")
+    return pool_size
+
+
+def _check_out_warm_kernel():
+    """Get an idle warm kernel, starting one if none is free and allowed.
+
+    Kernels are shut down at exit. If the pool is already at its size and
+    all its kernels are checked out, this waits for one to be returned (or
+    for a slot freed by a kernel that failed to start).
+
+    Raises
+    ------
+    RuntimeError
+        If no kernel becomes available within _WARM_KERNEL_CHECKOUT_TIMEOUT
+        seconds.
+    """
+    global _warm_kernel_count
+    deadline = time.monotonic() + _WARM_KERNEL_CHECKOUT_TIMEOUT
+    while True:
+        with _warm_kernel_lock:
+            if _warm_kernel_pool.empty() and \
+                    _warm_kernel_count < _get_warm_kernel_pool_size():
+                # claim the slot now, but start the kernel outside the lock
+                # so other threads aren't held up by its startup
+                _warm_kernel_count += 1
+                break
+        # end if a new kernel may be started
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(
+                f"No warm kernel became free within "
+                f"{_WARM_KERNEL_CHECKOUT_TIMEOUT} seconds.")
+        try:
+            return _warm_kernel_pool.get(
+                timeout=min(remaining, _WARM_KERNEL_POLL_INTERVAL))
+        except queue.Empty:
+            continue
+    # next attempt
+
+    try:
+        kernel_manager = KernelManager()
+        kernel_manager.start_kernel()
+    except BaseException:
+        # free the slot, or later runs would wait on a kernel that will
+        # never be returned
+        with _warm_kernel_lock:
+            _warm_kernel_count -= 1
+        raise
+    atexit.register(kernel_manager.shutdown_kernel, now=True)
+    return kernel_manager
+
+
+def _execute_in_warm_kernel(notebook_fp, parameters, output_fp, cwd):
+    """Parameterize a notebook and execute it in a kernel from the pool.
+
+    Like _execute_with_papermill, the executed notebook and its stdout and
+    stderr logs are written only if output_fp is given, and a failure
+    raises an AssertionError including the notebook's stdout and stderr.
+    """
+    nb = load_notebook_node(str(notebook_fp))
+    nb = parameterize_notebook(nb, parameters)
+    # since the kernel outlives each run, move it to this run's working
+    # directory (the previous run's may since have been deleted, which would
+    # break %reset) and then wipe any variables the previous run left behind
+    run_cwd = os.getcwd() if cwd is None else str(cwd)
+    setup_source = f"__import__('os').chdir({run_cwd!r})\n%reset -f"
+    nb.cells.insert(0, nbformat.v4.new_code_cell(setup_source))
+
+    kernel_manager = _check_out_warm_kernel()
+    client = NotebookClient(nb, km=kernel_manager)
+    try:
+        if not kernel_manager.is_alive():
+            # e.g. a previous notebook crashed the kernel
+            kernel_manager.restart_kernel(now=True)
+        client.execute()
+    except CellExecutionError as err:
+        raise AssertionError(_format_notebook_failure(
+            notebook_fp, err, _get_stream_text(nb, 'stdout'),
+            _get_stream_text(nb, 'stderr'))) from err
+    finally:
+        # the client doesn't own the kernel, so leaves its channels (and
+        # their sockets) open after executing; close them before the next run
+        if client.kc is not None:
+            client.kc.stop_channels()
+        _warm_kernel_pool.put(kernel_manager)
+
+        if output_fp is not None:
+            nbformat.write(nb, str(output_fp))
+            stdout_fp, stderr_fp = _get_notebook_log_fps(output_fp)
+            with open(stdout_fp, 'w') as stdout_file, \
+                    open(stderr_fp, 'w') as stderr_file:
+                stdout_file.write(_get_stream_text(nb, 'stdout'))
+                stderr_file.write(_get_stream_text(nb, 'stderr'))
+
+
+def _get_stream_text(nb, stream_name):
+    """Get all the text an executed notebook's cells wrote to a stream."""
+    return "".join(
+        output.text for cell in nb.cells for output in cell.get('outputs', [])
+        if output.output_type == 'stream' and output.name == stream_name)
+
+
+def _format_notebook_failure(notebook_fp, err, stdout_text, stderr_text):
+    """Describe a failed notebook run, including its stdout and stderr."""
+    return (f"Notebook {os.path.basename(str(notebook_fp))} failed: "
+            f"{err}\n--- notebook stdout ---\n{stdout_text}"
+            f"\n--- notebook stderr ---\n{stderr_text}")
+
+
+def run_notebook(notebook_fp, parameters, output_fp=None, cwd=None):
+    """Execute a notebook with the given parameters.
+
+    Parameters
+    ----------
+    notebook_fp: str or Path
+        Path to the notebook to execute.
+    parameters: dict
+        Parameters to inject into the notebook's parameters cell.
+    output_fp: str or Path, optional
+        Path to which to write the executed notebook, with its stdout and
+        stderr logs next to it, for inspecting them after the run. If None
+        (the default), none of these are written to disk.
+    cwd: str or Path, optional
+        Working directory for the notebook's kernel, so any relative paths
+        the notebook writes land there rather than in the test runner's
+        working directory. The runner's own working directory is not
+        changed. If None, the kernel inherits the runner's working directory.
+
+    Raises
+    ------
+    AssertionError
+        If the notebook fails; the message includes its stdout and stderr.
+    """
+    if _get_warm_kernel_pool_size():
+        _execute_in_warm_kernel(notebook_fp, parameters, output_fp, cwd)
+    else:
+        _execute_with_papermill(notebook_fp, parameters, output_fp, cwd)
+
+
+def _kernel_resources(cwd):
+    """Get nbclient resources that start the kernel in cwd, if given."""
+    if cwd is None:
+        return {}
+    return {'metadata': {'path': str(cwd)}}
+
+
+def _get_notebook_log_fps(output_fp):
+    """Get the paths of the stdout and stderr logs for an executed notebook."""
+    log_base = os.path.splitext(str(output_fp))[0]
+    return f"{log_base}_stdout.log", f"{log_base}_stderr.log"
+
+
+def _open_notebook_logs(output_fp):
+    """Open files to hold a notebook's stdout and stderr.
+
+    The logs are written next to output_fp if it is given; otherwise they
+    are anonymous temporary files, deleted when closed.
+    """
+    if output_fp is None:
+        return tempfile.TemporaryFile('w+'), tempfile.TemporaryFile('w+')
+
+    stdout_fp, stderr_fp = _get_notebook_log_fps(output_fp)
+    return open(stdout_fp, 'w+'), open(stderr_fp, 'w+')
+
+
+def _execute_with_papermill(notebook_fp, parameters, output_fp, cwd):
+    """Execute a notebook in a new kernel, logging its output to files.
+
+    The notebook's stdout and stderr are written to files rather than
+    logged to the console, so heavy printing in the notebook does not slow
+    the test run; if the notebook fails, their contents are included in the
+    raised AssertionError. Unless output_fp is given, papermill skips its
+    save after each cell; it still serializes the executed notebook once at
+    the end of the run, but then discards it rather than writing it.
+    """
+    stdout_file, stderr_file = _open_notebook_logs(output_fp)
+    with stdout_file, stderr_file:
+        try:
+            pm.execute_notebook(
+                input_path=str(notebook_fp),
+                output_path=None if output_fp is None else str(output_fp),
+                parameters=parameters,
+                progress_bar=False,
+                stdout_file=stdout_file,
+                stderr_file=stderr_file,
+                # papermill's own cwd argument would os.chdir the test runner
+                # for the duration of the run; instead, have nbclient start
+                # the kernel in cwd, leaving the runner's working directory be
+                resources=_kernel_resources(cwd),
+            )
+        except pm.PapermillExecutionError as err:
+            # the logs usually live in a temporary directory that is gone by
+            # the time the failure is reported, so include their contents
+            stdout_file.seek(0)
+            stderr_file.seek(0)
+            raise AssertionError(_format_notebook_failure(
+                notebook_fp, err, stdout_file.read(),
+                stderr_file.read())) from err
+
+
+def index_golden_files(test_output_dir, subdirs=EXPECTED_SUBDIRS):
+    """Map the names of the golden files to their paths.
+
+    Parameters
+    ----------
+    test_output_dir: str or Path
+        Path to the directory holding the golden file subdirectories.
+    subdirs: iterable of str, optional
+        Names of the subdirectories to index; missing ones are skipped.
+        Defaults to EXPECTED_SUBDIRS.
+
+    Returns
+    -------
+    dict
+        Maps each golden file's name to its full path.
+
+    Raises
+    ------
+    ValueError
+        If more than one of the subdirectories holds a file with the same
+        name, since it would be ambiguous which to compare against.
+    """
+    golden_index = {}
+    for subdir in subdirs:
+        subdir_fp = os.path.join(test_output_dir, subdir)
+        if not os.path.isdir(subdir_fp):
+            continue
+        with os.scandir(subdir_fp) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name in golden_index:
+                    raise ValueError(
+                        f"Golden file name '{entry.name}' is in more than one "
+                        f"subdirectory: {golden_index[entry.name]} and "
+                        f"{entry.path}")
+                golden_index[entry.name] = entry.path
+            # next entry
+    # next subdir
+
+    return golden_index
+
+
+def _file_digest(fp):
+    """Get the sha256 digest of a file's bytes."""
+    with open(fp, 'rb', buffering=_COMPARE_CHUNK_SIZE) as file:
+        if hasattr(hashlib, 'file_digest'):
+            # python >= 3.11
+            return hashlib.file_digest(file, 'sha256').digest()
+
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file.read(_COMPARE_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _golden_digest(golden_fp, size, mtime_ns):
+    """Get the (cached) sha256 digest of a golden file.
+
+    The file's size and modification time are part of the cache key so an
+    edited golden file is re-hashed rather than served stale.
+    """
+    return _file_digest(golden_fp)
+
+
+def _files_identical(produced_fp, expected_fp):
+    """Check if a produced file has exactly the same bytes as a golden file.
+
+    Files of different sizes are never identical, so are rejected without
+    being read; otherwise the produced file is hashed and compared to the
+    golden file's digest, which is computed only once per process.
+    """
+    expected_stat = os.stat(expected_fp)
+    if os.path.getsize(produced_fp) != expected_stat.st_size:
+        return False
+
+    expected_digest = _golden_digest(
+        str(expected_fp), expected_stat.st_size, expected_stat.st_mtime_ns)
+    return _file_digest(produced_fp) == expected_digest
+
+
+def assert_text_files_equal(test_case, produced_fp, expected_fp):
+    """Assert two text files match line by line, ignoring edge whitespace.
+
+    Parameters
+    ----------
+    test_case: unittest.TestCase
+        The test case to report a failure on.
+    produced_fp: str or Path
+        Path to the file produced by the test.
+    expected_fp: str or Path
+        Path to the expected ("golden") file.
+    """
+    # byte-identical files (the usual case) need no line-level comparison
+    if _files_identical(produced_fp, expected_fp):
+        return
+
+    # otherwise, stream both files in lockstep, stopping at the first line
+    # that differs, rather than reading them whole; text mode makes \r\n and
+    # lone \r line endings match \n ones
+    with open(produced_fp, 'r', buffering=_COMPARE_CHUNK_SIZE) as produced, \
+            open(expected_fp, 'r', buffering=_COMPARE_CHUNK_SIZE) as expected:
+        line_pairs = itertools.zip_longest(expected, produced)
+        for line_num, (expected_line, produced_line) in \
+                enumerate(line_pairs, start=1):
+            if expected_line is None or produced_line is None:
+                test_case.fail(
+                    "Line count mismatch in {}: {} has more lines, starting "
+                    "at line {}".format(
+                        os.path.basename(expected_fp),
+                        produced_fp if expected_line is None else expected_fp,
+                        line_num))
+
+            if expected_line.strip() != produced_line.strip():
+                test_case.fail(
+                    "Content mismatch in {} at line {}:\n"
+                    "expected: {}\nproduced: {}".format(
+                        os.path.basename(expected_fp), line_num,
+                        expected_line.strip(), produced_line.strip()))
+        # next line pair
+
+
+def compare_outputs(test_case, produced_dir, expected_names, golden_index):
+    """Assert that a notebook produced each expected file, matching its golden.
+
+    Parameters
+    ----------
+    test_case: unittest.TestCase
+        The test case to report a failure on.
+    produced_dir: str or Path
+        Path to the directory in which the notebook wrote its outputs.
+    expected_names: iterable of str
+        Names of the files the notebook is expected to produce.
+    golden_index: dict or None
+        Maps golden file names to their paths, as from index_golden_files.
+        A produced file without a golden file is only checked for existence
+        (with a warning). If None, no file is compared to its golden file.
+
+    Returns
+    -------
+    list of str
+        Names of the produced files that were compared to a golden file.
+    """
+    compared_names = []
+    for expected_name in expected_names:
+        produced_fp = os.path.join(produced_dir, expected_name)
+        test_case.assertTrue(
+            os.path.isfile(produced_fp),
+            msg=f"Notebook failed to produce the output file: "
+                f"{expected_name}")
+        if golden_index is None:
+            continue
+
+        golden_fp = golden_index.get(expected_name)
+        if golden_fp is None:
+            warnings.warn(f"Golden file for comparison is missing: "
+                          f"{expected_name}")
+            continue
+
+        assert_text_files_equal(test_case, produced_fp, golden_fp)
+        compared_names.append(expected_name)
+    # next expected_name
+
+    return compared_names
+
+
+class NotebookTestCase(unittest.TestCase):
+    """Base for tests that run a notebook and check the files it produces.
+
+    Each test gets a fresh temporary working directory (tmp_path) that is
+    removed after the test, along with the notebooks, test data and golden
+    file locations.
+    """
+
+    def setUp(self):
+        self.notebooks_dir = NOTEBOOKS_DIR
+        self.test_output_dir = TEST_OUTPUT_DIR
+        self.test_data_dir = TEST_DATA_DIR
+        self.golden_index = index_golden_files(self.test_output_dir)
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
+
+    def run_notebook_and_compare(self, notebook_name, parameters,
+                                 expected_names, compare_to_golden=True):
+        """Run a notebook in tmp_path and check the files it produces.
+
+        Parameters
+        ----------
+        notebook_name: str
+            Name of the notebook, relative to the notebooks directory.
+        parameters: dict
+            Parameters to inject into the notebook's parameters cell.
+        expected_names: iterable of str
+            Names of the files the notebook is expected to write to tmp_path.
+        compare_to_golden: bool, optional
+            If False, only check that the expected files exist. Default True.
+
+        Returns
+        -------
+        list of str
+            Names of the produced files that were compared to a golden file.
+        """
+        # tmp_path is deleted after the test, so don't write the executed
+        # notebook there
+        run_notebook(os.path.join(self.notebooks_dir, notebook_name),
+                     parameters, cwd=self.tmp_path)
+        golden_index = self.golden_index if compare_to_golden else None
+        return compare_outputs(
+            self, self.tmp_path, expected_names, golden_index)
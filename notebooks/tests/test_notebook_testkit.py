@@ -0,0 +1,279 @@
+import os
+import queue
+import tempfile
+import threading
+from unittest import TestCase, main
+from unittest.mock import patch, Mock
+
+if __package__:
+    from notebooks.tests import _notebook_testkit
+    from notebooks.tests._notebook_testkit import index_golden_files, \
+        assert_text_files_equal, _files_identical, _check_out_warm_kernel, \
+        _get_warm_kernel_pool_size, REUSE_KERNEL_ENV, WARM_KERNEL_POOL_ENV
+else:
+    # run as a script, so the notebooks package isn't importable but this
+    # directory is on sys.path
+    import _notebook_testkit
+    from _notebook_testkit import index_golden_files, \
+        assert_text_files_equal, _files_identical, _check_out_warm_kernel, \
+        _get_warm_kernel_pool_size, REUSE_KERNEL_ENV, WARM_KERNEL_POOL_ENV
+
+
+class TempFilesTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+
+    def _write(self, *path_parts, content="x\n"):
+        fp = os.path.join(self.tmp_dir, *path_parts)
+        os.makedirs(os.path.dirname(fp), exist_ok=True)
+        # newline='' so line endings are written exactly as given
+        with open(fp, 'w', newline='') as f:
+            f.write(content)
+        return fp
+
+
+class TestIndexGoldenFiles(TempFilesTestCase):
+
+    def test_index_golden_files(self):
+        qc_fp = self._write("QC", "plate_df.txt")
+        pooling_fp = self._write("Pooling", "picklist.txt")
+        # nested directories and subdirectories not in EXPECTED_SUBDIRS are
+        # not indexed
+        os.makedirs(os.path.join(self.tmp_dir, "Pooling", "nested"))
+        self._write("MRSA", "other.txt")
+
+        obs = index_golden_files(self.tmp_dir)
+        self.assertEqual(obs, {"plate_df.txt": qc_fp,
+                               "picklist.txt": pooling_fp})
+
+    def test_index_golden_files_err_duplicate_name(self):
+        self._write("QC", "picklist.txt")
+        self._write("Pooling", "picklist.txt")
+
+        with self.assertRaisesRegex(
+                ValueError, "Golden file name 'picklist.txt' is in more "
+                            "than one subdirectory"):
+            index_golden_files(self.tmp_dir)
+
+
+class TestFilesIdentical(TempFilesTestCase):
+    def test__files_identical(self):
+        golden_fp = self._write("golden.txt", content="a\tb\n1\t2\n")
+        same_fp = self._write("same.txt", content="a\tb\n1\t2\n")
+        self.assertTrue(_files_identical(same_fp, golden_fp))
+
+    def test__files_identical_different_size(self):
+        golden_fp = self._write("golden.txt", content="a\tb\n1\t2\n")
+        longer_fp = self._write("longer.txt", content="a\tb\n1\t2\n3\t4\n")
+        self.assertFalse(_files_identical(longer_fp, golden_fp))
+
+    def test__files_identical_same_size_different_bytes(self):
+        golden_fp = self._write("golden.txt", content="a\tb\n1\t2\n")
+        other_fp = self._write("other.txt", content="a\tb\n1\t3\n")
+        self.assertFalse(_files_identical(other_fp, golden_fp))
+
+    def test__files_identical_rehashes_edited_golden(self):
+        golden_fp = self._write("golden.txt", content="a\tb\n1\t2\n")
+        produced_fp = self._write("produced.txt", content="a\tb\n1\t2\n")
+        self.assertTrue(_files_identical(produced_fp, golden_fp))
+
+        # same size, new contents and modification time: the cached digest of
+        # the old contents must not be reused
+        golden_mtime_ns = os.stat(golden_fp).st_mtime_ns
+        self._write("golden.txt", content="a\tb\n1\t3\n")
+        os.utime(golden_fp, ns=(golden_mtime_ns + 10 ** 9,
+                                golden_mtime_ns + 10 ** 9))
+        self.assertFalse(_files_identical(produced_fp, golden_fp))
+
+
+class TestAssertTextFilesEqual(TempFilesTestCase):
+    def setUp(self):
+        super().setUp()
+        self.golden_fp = self._write(
+            "golden.txt", content="a\tb\n1\t2\n3\t4\n")
+
+    def test_assert_text_files_equal_identical(self):
+        produced_fp = self._write(
+            "produced.txt", content="a\tb\n1\t2\n3\t4\n")
+        assert_text_files_equal(self, produced_fp, self.golden_fp)
+
+    def test_assert_text_files_equal_whitespace_only_difference(self):
+        produced_fp = self._write(
+            "produced.txt", content="a\tb  \r\n 1\t2\n3\t4\t\n")
+        assert_text_files_equal(self, produced_fp, self.golden_fp)
+
+    def test_assert_text_files_equal_lone_cr_line_endings(self):
+        produced_fp = self._write(
+            "produced.txt", content="a\tb\r1\t2\r3\t4\r")
+        assert_text_files_equal(self, produced_fp, self.golden_fp)
+
+    def test_assert_text_files_equal_err_content_mismatch(self):
+        produced_fp = self._write(
+            "produced.txt", content="a\tb\n1\t5\n3\t4\n")
+        err = "Content mismatch in golden.txt at line 2:\nexpected: 1\t2"
+        with self.assertRaisesRegex(AssertionError, err):
+            assert_text_files_equal(self, produced_fp, self.golden_fp)
+
+    def test_assert_text_files_equal_err_extra_trailing_line(self):
+        produced_fp = self._write(
+            "produced.txt", content="a\tb\n1\t2\n3\t4\n5\t6\n")
+        err = ("Line count mismatch in golden.txt: .*produced.txt has more "
+               "lines")
+        with self.assertRaisesRegex(AssertionError, err):
+            assert_text_files_equal(self, produced_fp, self.golden_fp)
+
+    def test_assert_text_files_equal_err_missing_trailing_line(self):
+        produced_fp = self._write("produced.txt", content="a\tb\n1\t2\n")
+        err = ("Line count mismatch in golden.txt: .*golden.txt has more "
+               "lines")
+        with self.assertRaisesRegex(AssertionError, err):
+            assert_text_files_equal(self, produced_fp, self.golden_fp)
+
+
+class TestGetWarmKernelPoolSize(TestCase):
+    def _get_pool_size(self, env):
+        with patch.dict(os.environ, env):
+            for name in (REUSE_KERNEL_ENV, WARM_KERNEL_POOL_ENV):
+                if name not in env:
+                    os.environ.pop(name, None)
+            return _get_warm_kernel_pool_size()
+
+    def test__get_warm_kernel_pool_size(self):
+        self.assertEqual(self._get_pool_size({}), 0)
+        self.assertEqual(self._get_pool_size({REUSE_KERNEL_ENV: "1"}), 1)
+        self.assertEqual(self._get_pool_size({WARM_KERNEL_POOL_ENV: "3"}), 3)
+        self.assertEqual(self._get_pool_size(
+            {REUSE_KERNEL_ENV: "1", WARM_KERNEL_POOL_ENV: "3"}), 3)
+        # empty is the same as unset
+        self.assertEqual(self._get_pool_size(
+            {REUSE_KERNEL_ENV: "1", WARM_KERNEL_POOL_ENV: ""}), 1)
+
+    def test__get_warm_kernel_pool_size_err_not_positive(self):
+        for pool_size in ("0", "-1", "two"):
+            err = (f"{WARM_KERNEL_POOL_ENV} must be a positive integer, not "
+                   f"'{pool_size}'")
+            with self.assertRaisesRegex(ValueError, err):
+                self._get_pool_size(
+                    {REUSE_KERNEL_ENV: "1", WARM_KERNEL_POOL_ENV: pool_size})
+
+
+class TestCheckOutWarmKernel(TestCase):
+    def setUp(self):
+        # a stand-in for KernelManager that records the kernels it starts
+        # and can be told to fail to start, so no real kernel is needed
+        self.started_kernels = []
+        self.start_failures = 0
+        test_case = self
+
+        class FakeKernelManager:
+            def start_kernel(self):
+                if test_case.start_failures:
+                    test_case.start_failures -= 1
+                    raise RuntimeError("kernel failed to start")
+                test_case.started_kernels.append(self)
+
+            def shutdown_kernel(self, now=False):
+                pass
+
+        # give each test its own empty pool, with short waits so a test that
+        # would otherwise block forever fails instead
+        for name, value in (
+                ("KernelManager", FakeKernelManager),
+                ("atexit", Mock()),
+                ("_warm_kernel_pool", queue.Queue()),
+                ("_warm_kernel_count", 0),
+                ("_WARM_KERNEL_CHECKOUT_TIMEOUT", 5),
+                ("_WARM_KERNEL_POLL_INTERVAL", 0.01)):
+            patcher = patch.object(_notebook_testkit, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # next patched name
+
+    def _set_pool_size(self, pool_size):
+        patcher = patch.dict(
+            os.environ, {WARM_KERNEL_POOL_ENV: str(pool_size)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _check_in(self, kernel_manager):
+        _notebook_testkit._warm_kernel_pool.put(kernel_manager)
+
+    def test__check_out_warm_kernel_serial_reuses_one(self):
+        self._set_pool_size(3)
+        checked_out = []
+        for _ in range(3):
+            kernel_manager = _check_out_warm_kernel()
+            checked_out.append(kernel_manager)
+            self._check_in(kernel_manager)
+        # next checkout
+
+        self.assertEqual(len(self.started_kernels), 1)
+        self.assertEqual(checked_out, self.started_kernels * 3)
+        _notebook_testkit.atexit.register.assert_called_once()
+
+    def test__check_out_warm_kernel_concurrent_grows_to_pool_size(self):
+        self._set_pool_size(2)
+        first = _check_out_warm_kernel()
+        second = _check_out_warm_kernel()
+        self.assertIsNot(first, second)
+
+        # with both kernels checked out, a third run waits for one
+        waiting_result = []
+        waiting = threading.Thread(
+            target=lambda: waiting_result.append(_check_out_warm_kernel()))
+        waiting.start()
+        waiting.join(0.2)
+        self.assertTrue(waiting.is_alive())
+
+        self._check_in(first)
+        waiting.join(5)
+        self.assertFalse(waiting.is_alive())
+        self.assertEqual(waiting_result, [first])
+        self.assertEqual(self.started_kernels, [first, second])
+
+    def test__check_out_warm_kernel_many_threads(self):
+        self._set_pool_size(2)
+        errors = []
+
+        def run():
+            try:
+                self._check_in(_check_out_warm_kernel())
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.started_kernels), 2)
+        self.assertEqual(_notebook_testkit._warm_kernel_count,
+                         len(self.started_kernels))
+
+    def test__check_out_warm_kernel_failed_start_frees_slot(self):
+        self._set_pool_size(1)
+        self.start_failures = 1
+        with self.assertRaisesRegex(RuntimeError, "kernel failed to start"):
+            _check_out_warm_kernel()
+        self.assertEqual(_notebook_testkit._warm_kernel_count, 0)
+
+        # the next checkout starts a new kernel rather than waiting forever
+        kernel_manager = _check_out_warm_kernel()
+        self.assertEqual(self.started_kernels, [kernel_manager])
+
+    def test__check_out_warm_kernel_err_timeout(self):
+        self._set_pool_size(1)
+        _check_out_warm_kernel()
+        with patch.object(
+                _notebook_testkit, "_WARM_KERNEL_CHECKOUT_TIMEOUT", 0.05):
+            with self.assertRaisesRegex(
+                    RuntimeError, "No warm kernel became free within"):
+                _check_out_warm_kernel()
+
+
+if __name__ == '__main__':
+    main()